@@ -31,9 +31,11 @@ Mouse actions:
   Hover+Click Delete link region (cursor shows X)
 """
 
+import re
 import sys
 import json
 import argparse
+from collections import OrderedDict
 from pathlib import Path
 
 try:
@@ -58,15 +60,48 @@ except ImportError:
     sys.exit(1)
 
 
+# Number of rendered page images kept in memory for quick redisplay
+PAGE_CACHE_SIZE = 8
+
+# Zoom limits and increment for the Zoom +/- buttons
+ZOOM_MIN = 0.5
+ZOOM_MAX = 3.0
+ZOOM_STEP = 0.25
+
+# Cell size (PDF units) of the per-page grid used to hit-test link regions
+LINK_GRID_SIZE = 50
+
+# Delay (ms) after a page change before neighbouring pages are prefetched
+PREFETCH_DELAY_MS = 50
+
+# Max distance (PDF units) between a GOTO link target and a named destination
+DEST_MATCH_TOLERANCE = 5
+
+
+# Patterns used by title_to_id and add_custom_destination
+_DASH_TRANSLATION = str.maketrans({'–': '-', '—': '-'})
+_NON_ID_CHARS = re.compile(r'[^a-z0-9\s-]+')
+_SPACES_OR_DASHES = re.compile(r'[\s-]+')
+_URL_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+# PyMuPDF link kinds and the link keys diagnose_pdf prints separately
+_PDF_LINK_KIND_NAMES = {
+    0: "LINK_NONE",
+    1: "LINK_GOTO",
+    2: "LINK_URI",
+    3: "LINK_LAUNCH",
+    4: "LINK_NAMED",
+    5: "LINK_GOTOR"
+}
+_DIAGNOSE_SKIP_KEYS = frozenset({'kind', 'from', 'xref'})
+
+
 def title_to_id(title):
     """Convert title to URL-friendly ID (lowercase, hyphens)."""
-    import re
-    # Normalize special characters
-    id_str = title.lower()
-    id_str = id_str.replace('–', '-').replace('—', '-').replace('…', '').replace('...', '')
-    id_str = re.sub(r'[^a-z0-9\s-]', '', id_str)
-    id_str = re.sub(r'\s+', '-', id_str)
-    id_str = re.sub(r'-+', '-', id_str)
+    # Normalize dashes; other punctuation (e.g. ellipses) is stripped below
+    id_str = title.lower().translate(_DASH_TRANSLATION)
+    id_str = _NON_ID_CHARS.sub('', id_str)
+    id_str = _SPACES_OR_DASHES.sub('-', id_str)
     return id_str.strip('-')
 
 
@@ -94,26 +129,57 @@ def load_destinations_from_json(json_path, pdf_name):
 
 
 class PDFDestinationPicker:
-    def __init__(self, pdf_path, destinations=None):
+    def __init__(self, pdf_path, destinations=None, quiet=False):
         self.pdf_path = Path(pdf_path)
-        self.sections = list(destinations) if destinations else []
+        self.quiet = quiet  # Suppress the loading report
+        self._log = []  # Loading report lines, written out in one go
+        # Resolve each section's ID once so callers can use section['id'] directly
+        self.sections = [
+            dict(section, id=section.get('id') or title_to_id(section.get('title', '')))
+            for section in (destinations or [])
+        ]
+        self._section_id_set = {s['id'] for s in self.sections}  # Kept in sync with self.sections
         self.current_section_idx = 0
         self.destinations = {}  # Dict of section_id -> (page_num, x, y)
         self.existing_destinations = {}  # Destinations already in the PDF
         self.custom_sections = []  # List of custom sections added by user
 
         self.doc = fitz.open(str(self.pdf_path))
+        self._n_pages = len(self.doc)
+        self._page_widths = [page.rect.width for page in self.doc]
+        self._page_heights = [page.rect.height for page in self.doc]
         self.current_page = 0
         self.zoom = 1.0
+        self._page_cache = OrderedDict()  # (page_num, zoom) -> (photo, width, height)
+        self._page_image_item = None  # Canvas item showing the page image
+        self._marker_pool = []  # Reusable (oval, text) canvas items for markers
+        self._link_pool = []  # Reusable (rectangle, text) canvas items for links
+        self._page_height_px = 0  # Height of the page image on the canvas
+        self._overlay_band = (0, 0)  # Canvas y-range the overlays were laid out for
+        self._pending_scroll = 0  # Wheel scroll units not yet applied
+        self._scroll_job = None  # Pending after_idle callback id for scrolling
+        self._last_rendered = (None, None)  # (page_num, zoom) currently on the canvas
+        self._page_ref_to_idx = {}  # Page object idnum -> page index
+        self._dest_by_cell = {}  # (page_num, cell_x, cell_y) -> [(order, dest_id), ...]
+        self._dests_by_page = {}  # page_num -> {section_id: (x, y)} mirroring self.destinations
+        self._prefetch_queue = []  # (page_num, zoom) pages to render ahead
+        self._prefetch_job = None  # Pending after_idle callback id
 
         # For link annotation drawing
         self.link_annotations = []  # List of {page, rect, dest_id, type}
+        self._links_by_page = {}  # page_num -> link_annotations entries on that page
+        self._link_grid = {}  # page_num -> {(cell_x, cell_y): [index into page links]}
+        self._link_canvas_rects = []  # Canvas-space rects of the current page's links
+        self._link_canvas_rects_key = None  # (page_num, zoom) the rects were computed for
         self.original_link_count = 0  # Track how many links were loaded initially
+        self._original_links_by_page = {}  # page_num -> number of links loaded from the PDF
         self.drag_start = None
         self.drag_rect = None
 
         # Load existing named destinations from PDF
         self.load_existing_destinations()
+        self._build_destination_index()
+        self._rebuild_marker_index()
         self.load_existing_links()
 
         self.setup_ui()
@@ -121,29 +187,36 @@ class PDFDestinationPicker:
     def load_existing_destinations(self):
         """Load named destinations already present in the PDF."""
         try:
+            # Avoid importing pypdf and parsing the file when there is nothing to read
+            if not self._has_named_destinations():
+                self._log.append("No existing destinations found.\n")
+                self._flush_log()
+                return
+
             from pypdf import PdfReader
             reader = PdfReader(str(self.pdf_path))
 
-            # Build a map of page indirect references to page indices
+            # Build a map of page indirect references to page indices (once)
             page_ref_to_idx = {}
             for i, page in enumerate(reader.pages):
                 if page.indirect_reference:
                     page_ref_to_idx[page.indirect_reference.idnum] = i
+            self._page_ref_to_idx = page_ref_to_idx
 
             # Method 1: Try pypdf's named_destinations (reads from /Names tree)
             named_dests = reader.named_destinations
 
             if named_dests:
-                print(f"Existing destinations found in PDF (Names tree):")
+                self._log.append(f"Existing destinations found in PDF (Names tree):")
                 for name, dest in named_dests.items():
-                    self._process_destination(name, dest, reader, page_ref_to_idx)
+                    self._process_destination(name, dest)
 
             # Method 2: Also check /Dests in catalog (our custom format)
             if hasattr(reader, '_root_object') and '/Dests' in reader._root_object:
                 dests_obj = reader._root_object['/Dests']
                 if hasattr(dests_obj, 'get_object'):
                     dests_obj = dests_obj.get_object()
-                print(f"Existing destinations found in PDF (Dests catalog):")
+                self._log.append(f"Existing destinations found in PDF (Dests catalog):")
                 for name, dest_array in dests_obj.items():
                     clean_name = str(name).lstrip('/')
                     if clean_name in self.existing_destinations:
@@ -156,20 +229,11 @@ class PDFDestinationPicker:
                     if isinstance(dest_array, list) and len(dest_array) >= 2:
                         page_ref = dest_array[0]
 
-                        # Find page index using idnum
-                        page_idx = None
-                        if hasattr(page_ref, 'idnum'):
-                            page_idx = page_ref_to_idx.get(page_ref.idnum)
-                        elif hasattr(page_ref, 'get_object'):
-                            resolved = page_ref.get_object()
-                            for i, page in enumerate(reader.pages):
-                                if page.get_object() == resolved:
-                                    page_idx = i
-                                    break
+                        page_idx = self._page_index_for_ref(page_ref)
 
                         if page_idx is not None:
                             x, y = 0, 0
-                            page_height = self.doc[page_idx].rect.height
+                            page_height = self._page_heights[page_idx]
 
                             if len(dest_array) >= 4 and str(dest_array[1]) == '/XYZ':
                                 try:
@@ -180,16 +244,15 @@ class PDFDestinationPicker:
                                     pass
 
                             self.existing_destinations[clean_name] = (page_idx, x, y)
-                            print(f"  * {clean_name} -> page {page_idx + 1}, position ({x:.0f}, {y:.0f})")
+                            self._log.append(f"  * {clean_name} -> page {page_idx + 1}, position ({x:.0f}, {y:.0f})")
                         else:
-                            print(f"  ! {clean_name} -> could not determine page")
+                            self._log.append(f"  ! {clean_name} -> could not determine page")
 
             # Pre-populate destinations dict with existing ones that match our sections
             matched_count = 0
-            section_ids = {s.get('id', title_to_id(s.get('title', ''))) for s in self.sections}
 
             for section in self.sections:
-                section_id = section.get('id', title_to_id(section.get('title', '')))
+                section_id = section['id']
                 if section_id in self.existing_destinations:
                     self.destinations[section_id] = self.existing_destinations[section_id]
                     matched_count += 1
@@ -197,7 +260,7 @@ class PDFDestinationPicker:
             # Add unmatched destinations from PDF as custom sections
             custom_count = 0
             for dest_id, dest_data in self.existing_destinations.items():
-                if dest_id not in section_ids:
+                if dest_id not in self._section_id_set:
                     # Skip common bookmark patterns from publishing software
                     if ':' in dest_id and any(x in dest_id.lower() for x in ['bladwijzer', 'bookmark', 'toc']):
                         continue
@@ -209,50 +272,65 @@ class PDFDestinationPicker:
                         "type": "local"
                     }
                     self.sections.append(custom_section)
+                    self._section_id_set.add(dest_id)
                     self.destinations[dest_id] = dest_data
                     custom_count += 1
 
             if self.existing_destinations:
-                print(f"\n{len(self.existing_destinations)} existing destinations loaded.")
-                print(f"{matched_count} matched to config, {custom_count} loaded as custom.")
+                self._log.append(f"\n{len(self.existing_destinations)} existing destinations loaded.")
+                self._log.append(f"{matched_count} matched to config, {custom_count} loaded as custom.")
             else:
-                print("No existing destinations found.\n")
+                self._log.append("No existing destinations found.\n")
+            self._flush_log()
 
         except Exception as e:
+            self._flush_log()
             import traceback
             print(f"Could not load existing destinations: {e}")
             traceback.print_exc()
 
-    def _process_destination(self, name, dest, reader, page_ref_to_idx):
+    def _has_named_destinations(self):
+        """Check the catalog for /Dests or a /Names destination tree using MuPDF."""
+        if not self.doc.is_pdf:
+            return False
+        catalog = self.doc.pdf_catalog()
+        return any(
+            self.doc.xref_get_key(catalog, key)[0] != "null"
+            for key in ("Dests", "Names/Dests")
+        )
+
+    def _flush_log(self):
+        """Write buffered loading messages with a single write, unless quiet."""
+        if self._log and not self.quiet:
+            sys.stdout.write("\n".join(self._log) + "\n")
+        self._log = []
+
+    def _page_index_for_ref(self, page_ref):
+        """Map a pypdf page reference to a page index using its object number."""
+        idnum = getattr(page_ref, 'idnum', None)
+        if idnum is None and hasattr(page_ref, 'get_object'):
+            # Resolve once and use the page's own indirect reference
+            resolved = page_ref.get_object()
+            idnum = getattr(getattr(resolved, 'indirect_reference', None), 'idnum', None)
+        return self._page_ref_to_idx.get(idnum)
+
+    def _process_destination(self, name, dest):
         """Process a single destination from pypdf."""
         clean_name = str(name).lstrip('/')
 
         page_idx = None
 
         if hasattr(dest, 'page') and dest.page is not None:
-            if hasattr(dest.page, 'idnum'):
-                page_idx = page_ref_to_idx.get(dest.page.idnum)
-            if page_idx is None:
-                for i, page in enumerate(reader.pages):
-                    if page.indirect_reference == dest.page:
-                        page_idx = i
-                        break
+            page_idx = self._page_index_for_ref(dest.page)
 
         if page_idx is None and '/Page' in dest:
-            page_ref = dest['/Page']
-            if hasattr(page_ref, 'idnum'):
-                page_idx = page_ref_to_idx.get(page_ref.idnum)
-            if page_idx is None:
-                for i, page in enumerate(reader.pages):
-                    if page.indirect_reference == page_ref:
-                        page_idx = i
-                        break
+            page_idx = self._page_index_for_ref(dest['/Page'])
 
         if page_idx is None:
-            print(f"  ! {clean_name} -> could not determine page")
+            self._log.append(f"  ! {clean_name} -> could not determine page")
             return
 
-        page_height = self.doc[page_idx].rect.height
+        page_height = self._page_heights[page_idx]
 
         x, y = 0, 0
         if hasattr(dest, 'left') and dest.left is not None:
@@ -262,12 +340,12 @@ class PDFDestinationPicker:
             y = page_height - pdf_y
 
         self.existing_destinations[clean_name] = (page_idx, x, y)
-        print(f"  * {clean_name} -> page {page_idx + 1}, position ({x:.0f}, {y:.0f})")
+        self._log.append(f"  * {clean_name} -> page {page_idx + 1}, position ({x:.0f}, {y:.0f})")
 
     def load_existing_links(self):
         """Load existing link annotations from the PDF."""
         try:
-            for page_num in range(len(self.doc)):
+            for page_num in range(self._n_pages):
                 page = self.doc[page_num]
                 links = page.get_links()
 
@@ -299,13 +377,14 @@ class PDFDestinationPicker:
                                 "existing": True
                             })
                             # Add as custom URL section if not already present
-                            if not any(s.get('id') == uri for s in self.sections):
+                            if uri not in self._section_id_set:
                                 self.sections.append({
                                     "id": uri,
                                     "title": uri,
                                     "custom": True,
                                     "type": "url"
                                 })
+                                self._section_id_set.add(uri)
                     elif link_type == fitz.LINK_GOTO:
                         dest_page = link.get("page", 0)
                         dest_name = link.get("nameddest", link.get("name", ""))
@@ -347,22 +426,128 @@ class PDFDestinationPicker:
                                 "existing": True
                             })
 
+            self._rebuild_link_index()
+            self._original_links_by_page = {p: len(links) for p, links in self._links_by_page.items()}
             if self.link_annotations:
                 self.original_link_count = len(self.link_annotations)
-                print(f"{len(self.link_annotations)} existing link annotations loaded.\n")
+                self._log.append(f"{len(self.link_annotations)} existing link annotations loaded.\n")
+            self._flush_log()
         except Exception as e:
+            self._flush_log()
             import traceback
             print(f"Could not load existing links: {e}")
             traceback.print_exc()
 
-    def _find_destination_by_position(self, page_num, x, y, tolerance=5):
-        """Find a destination that matches the given page and position."""
-        for dest_id, (dest_page, dest_x, dest_y) in self.existing_destinations.items():
-            if dest_page == page_num:
-                if abs(dest_x - x) < tolerance and abs(dest_y - y) < tolerance:
-                    return dest_id
+    def _build_destination_index(self):
+        """Bucket existing destinations into a per-page grid for position lookups."""
+        self._dest_by_cell = {}
+        for order, (dest_id, (dest_page, dest_x, dest_y)) in enumerate(self.existing_destinations.items()):
+            cell = (dest_page, int(dest_x // DEST_MATCH_TOLERANCE), int(dest_y // DEST_MATCH_TOLERANCE))
+            self._dest_by_cell.setdefault(cell, []).append((order, dest_id))
+
+    def _rebuild_marker_index(self):
+        """Group positioned destinations by page for marker drawing."""
+        self._dests_by_page = {}
+        for section_id, (page_num, x, y) in self.destinations.items():
+            self._dests_by_page.setdefault(page_num, {})[section_id] = (x, y)
+
+    def _set_destination(self, section_id, page_num, x, y):
+        """Set a destination position, keeping the per-page marker index in sync."""
+        self._clear_destination(section_id)
+        self.destinations[section_id] = (page_num, x, y)
+        self._dests_by_page.setdefault(page_num, {})[section_id] = (x, y)
+
+    def _clear_destination(self, section_id):
+        """Remove a destination position if set; return whether one was removed."""
+        if section_id not in self.destinations:
+            return False
+        page_num = self.destinations.pop(section_id)[0]
+        self._dests_by_page.get(page_num, {}).pop(section_id, None)
+        return True
+
+    def _rebuild_link_index(self):
+        """Group link_annotations by page for overlay drawing and hit-testing."""
+        self._links_by_page = {}
+        self._link_grid = {}
+        self._link_canvas_rects_key = None
+        for link in self.link_annotations:
+            self._links_by_page.setdefault(link["page"], []).append(link)
+
+    def _links_changed(self, page_num):
+        """Drop cached hit-test data after links on a page were added or removed."""
+        self._link_grid.pop(page_num, None)
+        if page_num == self.current_page:
+            self._link_canvas_rects_key = None
+
+    def _current_link_canvas_rects(self):
+        """Return canvas-space rects for the current page's links, in list order."""
+        if self._link_canvas_rects_key != (self.current_page, self.zoom):
+            self._rebuild_canvas_rects()
+        return self._link_canvas_rects
+
+    def _rebuild_canvas_rects(self):
+        """Scale the current page's link rects by the zoom once per page/zoom change."""
+        zoom = self.zoom
+        self._link_canvas_rects = [
+            (x0 * zoom, y0 * zoom, x1 * zoom, y1 * zoom)
+            for x0, y0, x1, y1 in (link["rect"] for link in self._links_by_page.get(self.current_page, ()))
+        ]
+        self._link_canvas_rects_key = (self.current_page, zoom)
+
+    def _link_grid_for_page(self, page_num):
+        """Return the page's link hit-test grid, building it on first use."""
+        grid = self._link_grid.get(page_num)
+        if grid is None:
+            grid = {}
+            # Link rects are not clipped to the page; clamp them to its cells so
+            # an oversized annotation cannot blow up the grid. Anything beyond
+            # the page edge lands in the edge cells, where queries are clamped too.
+            for i, link in enumerate(self._links_by_page.get(page_num, ())):
+                x0, y0, x1, y1 = link["rect"]
+                cell_x0, cell_y0 = self._link_grid_cell(page_num, x0, y0)
+                cell_x1, cell_y1 = self._link_grid_cell(page_num, x1, y1)
+                for cell_x in range(cell_x0, cell_x1 + 1):
+                    for cell_y in range(cell_y0, cell_y1 + 1):
+                        grid.setdefault((cell_x, cell_y), []).append(i)
+            self._link_grid[page_num] = grid
+        return grid
+
+    def _link_grid_cell(self, page_num, x, y):
+        """Return the link grid cell for a page-space point, clamped to the page."""
+        max_cell_x = int(self._page_widths[page_num] // LINK_GRID_SIZE)
+        max_cell_y = int(self._page_heights[page_num] // LINK_GRID_SIZE)
+        cell_x = min(max(int(x // LINK_GRID_SIZE), 0), max_cell_x)
+        cell_y = min(max(int(y // LINK_GRID_SIZE), 0), max_cell_y)
+        return cell_x, cell_y
+
+    def _link_index_at(self, canvas_x, canvas_y):
+        """Return the index of the first current-page link under a canvas point, or None."""
+        cell = self._link_grid_cell(self.current_page, canvas_x / self.zoom, canvas_y / self.zoom)
+        canvas_rects = self._current_link_canvas_rects()
+        # Candidates are in list order, so the first hit matches a linear scan
+        for i in self._link_grid_for_page(self.current_page).get(cell, ()):
+            cx0, cy0, cx1, cy1 = canvas_rects[i]
+            if cx0 <= canvas_x <= cx1 and cy0 <= canvas_y <= cy1:
+                return i
         return None
 
+    def _find_destination_by_position(self, page_num, x, y):
+        """Find a destination that matches the given page and position."""
+        # Any match within tolerance lies in the same grid cell or a neighbour
+        cell_x = int(x // DEST_MATCH_TOLERANCE)
+        cell_y = int(y // DEST_MATCH_TOLERANCE)
+        # Return the match that comes first in existing_destinations, as a
+        # linear scan would, not the first in neighbourhood order
+        best = None
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for candidate in self._dest_by_cell.get((page_num, cell_x + dx, cell_y + dy), ()):
+                    _, dest_x, dest_y = self.existing_destinations[candidate[1]]
+                    if abs(dest_x - x) < DEST_MATCH_TOLERANCE and abs(dest_y - y) < DEST_MATCH_TOLERANCE:
+                        if best is None or candidate < best:
+                            best = candidate
+        return best[1] if best is not None else None
+
     def setup_ui(self):
         self.root = tk.Tk()
         self.root.title(f"PDF Destinator - {self.pdf_path.name}")
@@ -425,7 +610,7 @@ class PDFDestinationPicker:
             canvas_frame,
             width=800,
             height=600,
-            yscrollcommand=self.v_scroll.set,
+            yscrollcommand=self._on_canvas_yview,
             xscrollcommand=self.h_scroll.set
         )
 
@@ -443,7 +628,7 @@ class PDFDestinationPicker:
 
         # Mouse motion for hover effects (link deletion)
         self.canvas.bind("<Motion>", self.on_mouse_motion)
-        self.hovered_link_index = None
+        self.hovered_link_index = None  # Index into the current page's links
 
         # Mouse wheel scrolling
         self.canvas.bind("<Button-4>", self.on_scroll_up)
@@ -512,8 +697,6 @@ class PDFDestinationPicker:
 
     def add_custom_destination(self):
         """Add a custom destination - either local (text) or external (URL)."""
-        import re
-
         text = simpledialog.askstring(
             "New destination",
             "Enter title (for local destination) or URL (for external link):",
@@ -521,33 +704,30 @@ class PDFDestinationPicker:
         )
         if text:
             text = text.strip()
-            url_pattern = re.compile(r'^https?://', re.IGNORECASE)
-            if url_pattern.match(text):
-                dest_id = text
-                new_dest = {"id": dest_id, "title": text, "custom": True, "type": "url"}
-                self.sections.append(new_dest)
-                self.custom_sections.append(new_dest)
-                self.update_section_list()
-                self.current_section_idx = len(self.sections) - 1
-                self.update_display()
+            if _URL_RE.match(text):
+                self._append_section(text, text, "url")
                 print(f"+ External URL added: {text}")
             else:
                 dest_id = title_to_id(text)
-                new_dest = {"id": dest_id, "title": text, "custom": True, "type": "local"}
-                self.sections.append(new_dest)
-                self.custom_sections.append(new_dest)
-                self.update_section_list()
-                self.current_section_idx = len(self.sections) - 1
-                self.update_display()
+                self._append_section(dest_id, text, "local")
                 print(f"+ Local destination added: {text} (id: {dest_id})")
 
+    def _append_section(self, dest_id, title, type_):
+        """Append a user-added section, select it and refresh the UI."""
+        new_dest = {"id": dest_id, "title": title, "custom": True, "user_added": True, "type": type_}
+        self.sections.append(new_dest)
+        self.custom_sections.append(new_dest)
+        self._section_id_set.add(dest_id)
+        self.current_section_idx = len(self.sections) - 1
+        self.update_display()
+
     def remove_destination(self):
         """Remove the current destination from the list."""
         if self.current_section_idx >= len(self.sections):
             return
 
         section = self.sections[self.current_section_idx]
-        section_id = section.get('id', title_to_id(section.get('title', '')))
+        section_id = section['id']
         title = section.get('title', section_id)
 
         link_count = sum(1 for l in self.link_annotations if l['dest_id'] == section_id)
@@ -559,16 +739,19 @@ class PDFDestinationPicker:
             return
 
         self.sections.pop(self.current_section_idx)
+        # Sections may share an ID, so only forget it once the last one is gone
+        if not any(s['id'] == section_id for s in self.sections):
+            self._section_id_set.discard(section_id)
 
-        if section in self.custom_sections:
+        if section.get('user_added'):
             self.custom_sections.remove(section)
 
-        if section_id in self.destinations:
-            del self.destinations[section_id]
+        self._clear_destination(section_id)
         if section_id in self.existing_destinations:
             del self.existing_destinations[section_id]
 
         self.link_annotations = [l for l in self.link_annotations if l['dest_id'] != section_id]
+        self._rebuild_link_index()
 
         if self.current_section_idx >= len(self.sections) and len(self.sections) > 0:
             self.current_section_idx = len(self.sections) - 1
@@ -581,7 +764,7 @@ class PDFDestinationPicker:
         """Update the destination listbox with status markers."""
         self.section_listbox.delete(0, tk.END)
         for i, section in enumerate(self.sections):
-            section_id = section.get('id', title_to_id(section.get('title', '')))
+            section_id = section['id']
             title = section.get('title', section_id)
             is_url = section.get('type') == 'url'
 
@@ -595,7 +778,7 @@ class PDFDestinationPicker:
                 prefix = "[ ] "
 
             # Only show (custom) for interactively added destinations, not PDF-loaded ones
-            if section in self.custom_sections and not is_url:
+            if section.get('user_added') and not is_url:
                 suffix = " (custom)"
             else:
                 suffix = ""
@@ -608,38 +791,55 @@ class PDFDestinationPicker:
             self.section_listbox.selection_set(self.current_section_idx)
             self.section_listbox.see(self.current_section_idx)
 
-    def render_page(self):
-        """Render the current page to an image."""
-        page = self.doc[self.current_page]
-        mat = fitz.Matrix(self.zoom, self.zoom)
-        pix = page.get_pixmap(matrix=mat)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        return img, pix.width, pix.height
+    def _get_page_image(self, page_num, zoom):
+        """Return the cached (photo, width, height) for a page, rendering it on a miss."""
+        key = (page_num, round(zoom, 3))
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            self._page_cache.move_to_end(key)
+            return cached
+
+        mat = fitz.Matrix(zoom, zoom)
+        # Force tightly packed RGB so the samples match PIL's "RGB" raw layout
+        pix = self.doc[page_num].get_pixmap(matrix=mat, colorspace=fitz.csRGB, alpha=False)
+        # Wrap the pixmap's sample buffer instead of copying it; both are only
+        # needed until Tk has taken its own copy in PhotoImage
+        img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1)
+        # Upload to Tk once; the cache also keeps the PhotoImage from being collected
+        photo = ImageTk.PhotoImage(img)
+
+        rendered = (photo, pix.width, pix.height)
+        self._page_cache[key] = rendered
+        if len(self._page_cache) > PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+        return rendered
 
     def update_display(self):
         """Update the UI with current status."""
         if self.current_section_idx < len(self.sections):
             section = self.sections[self.current_section_idx]
             title = section.get('title', section.get('id', '?'))
-            section_id = section.get('id', title_to_id(title))
+            section_id = section['id']
 
             self.section_var.set(title)
             self.section_id_label.config(text=f"ID: {section_id}")
 
             local_dests = [s for s in self.sections if s.get('type') != 'url']
-            completed = sum(1 for s in local_dests if s.get('id', title_to_id(s.get('title', ''))) in self.destinations)
+            completed = sum(1 for s in local_dests if s['id'] in self.destinations)
             self.progress_label.config(text=f"Destination {self.current_section_idx + 1} of {len(self.sections)} ({completed} positioned)")
 
             is_url = section.get('type') == 'url'
+            dest = self.destinations.get(section_id)
+            existing = self.existing_destinations.get(section_id)
 
             if is_url:
                 self.instruction_label.config(
                     text="[URL] External URL - drag a rectangle to create a clickable link region",
                     foreground="purple"
                 )
-            elif section_id in self.destinations:
-                page_num, x, y = self.destinations[section_id]
-                if section_id in self.existing_destinations and self.destinations[section_id] == self.existing_destinations[section_id]:
+            elif dest is not None:
+                page_num = dest[0]
+                if dest == existing:
                     self.instruction_label.config(
                         text=f"[o] Existing on page {page_num + 1} - click to change, drag to add link",
                         foreground="orange"
@@ -649,8 +849,8 @@ class PDFDestinationPicker:
                         text=f"[x] Position on page {page_num + 1} - drag to add a link region",
                         foreground="green"
                     )
-            elif section_id in self.existing_destinations:
-                page_num, x, y = self.existing_destinations[section_id]
+            elif existing is not None:
+                page_num = existing[0]
                 self.instruction_label.config(
                     text=f"[o] Existing on page {page_num + 1} - click to change, drag to add link",
                     foreground="orange"
@@ -668,76 +868,160 @@ class PDFDestinationPicker:
 
         self.update_section_list()
 
-        self.page_label.config(text=f"Page {self.current_page + 1} / {len(self.doc)}")
+        self.page_label.config(text=f"Page {self.current_page + 1} / {self._n_pages}")
         self.zoom_label.config(text=f"{int(self.zoom * 100)}%")
 
-        img, width, height = self.render_page()
-        self.tk_img = ImageTk.PhotoImage(img)
-
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor="nw", image=self.tk_img)
-        self.canvas.config(scrollregion=(0, 0, width, height))
-
-        current_section = self.sections[self.current_section_idx] if self.current_section_idx < len(self.sections) else None
-        current_id = current_section.get('id', title_to_id(current_section.get('title', ''))) if current_section else None
+        # Only re-render the page when page or zoom changed; overlays are cheap
+        if self._last_rendered != (self.current_page, self.zoom):
+            self._refresh_page_image()
+            self._schedule_prefetch()
+        self._refresh_overlays()
 
-        # Draw markers for destinations on this page
-        for section_id, (page_num, x, y) in self.destinations.items():
-            if page_num == self.current_page:
-                canvas_x = x * self.zoom
-                canvas_y = y * self.zoom
+    def _current_section_id(self):
+        """Return the ID of the currently selected section, or None."""
+        if self.current_section_idx >= len(self.sections):
+            return None
+        section = self.sections[self.current_section_idx]
+        return section['id']
 
-                if section_id == current_id:
-                    color = "blue"
-                    width_val = 4
-                else:
-                    color = "green"
-                    width_val = 2
+    def _refresh_page_image(self):
+        """Redraw the rendered page image layer."""
+        self.tk_img, width, height = self._get_page_image(self.current_page, self.zoom)
 
-                self.canvas.create_oval(
-                    canvas_x - 10, canvas_y - 10,
-                    canvas_x + 10, canvas_y + 10,
-                    outline=color, width=width_val
-                )
+        if self._page_image_item is None:
+            self._page_image_item = self.canvas.create_image(0, 0, anchor="nw", image=self.tk_img, tags="page_image")
+            self.canvas.tag_lower("page_image")
+        else:
+            self.canvas.itemconfig(self._page_image_item, image=self.tk_img)
+        self.canvas.config(scrollregion=(0, 0, width, height))
+        self._page_height_px = height
+        self._last_rendered = (self.current_page, self.zoom)
+
+    def _schedule_prefetch(self):
+        """Queue the neighbouring pages for rendering once navigation settles."""
+        self._prefetch_queue = [
+            (p, self.zoom) for p in (self.current_page + 1, self.current_page - 1)
+            if 0 <= p < self._n_pages
+        ]
+        # Restart the delay on every page change so held-down arrow keys don't
+        # prefetch pages that are skipped past anyway
+        if self._prefetch_job is not None:
+            self.root.after_cancel(self._prefetch_job)
+        self._prefetch_job = self.root.after(PREFETCH_DELAY_MS, self._prefetch_next)
+
+    def _prefetch_next(self):
+        """Render one queued page into the cache, then yield back to Tk."""
+        self._prefetch_job = None
+        if self.doc.is_closed or not self._prefetch_queue:
+            return
+        page_num, zoom = self._prefetch_queue.pop(0)
+        # Skip stale entries (zoom changed) and pages that are already cached
+        if zoom == self.zoom and (page_num, round(zoom, 3)) not in self._page_cache:
+            self._get_page_image(page_num, zoom)
+        if self._prefetch_queue:
+            self._prefetch_job = self.root.after_idle(self._prefetch_next)
+
+    def _refresh_overlays(self):
+        """Update the marker and link layers, leaving the page image untouched."""
+        # Only lay out overlays in and around the visible part of the page
+        first, last = self.canvas.yview()
+        margin = (last - first) * self._page_height_px
+        band = (first * self._page_height_px - margin, last * self._page_height_px + margin)
+        self._overlay_band = band
+
+        self._refresh_markers(band)
+        self._refresh_links(band)
+
+    def _on_canvas_yview(self, first, last):
+        """Sync the scrollbar and re-cull overlays once the view leaves the laid-out band."""
+        self.v_scroll.set(first, last)
+        top = float(first) * self._page_height_px
+        bottom = float(last) * self._page_height_px
+        band_top, band_bottom = self._overlay_band
+        if top < band_top or bottom > band_bottom:
+            self._refresh_overlays()
+
+    def _refresh_markers(self, band):
+        """Update the destination marker layer for the current page within a y-band."""
+        current_id = self._current_section_id()
+        band_top, band_bottom = band
+
+        # Reuse pooled canvas items, moving them in place rather than recreating
+        shown = 0
+        for section_id, (x, y) in self._dests_by_page.get(self.current_page, {}).items():
+            canvas_x = x * self.zoom
+            canvas_y = y * self.zoom
+            if canvas_y + 10 < band_top or canvas_y - 10 > band_bottom:
+                continue
 
-                display_id = section_id[:25] + "..." if len(section_id) > 25 else section_id
-                self.canvas.create_text(
-                    canvas_x + 15, canvas_y,
-                    text=display_id,
-                    anchor="w",
-                    fill=color,
-                    font=("Arial", 9)
-                )
+            if section_id == current_id:
+                color = "blue"
+                width_val = 4
+            else:
+                color = "green"
+                width_val = 2
+
+            display_id = section_id[:25] + "..." if len(section_id) > 25 else section_id
+
+            if shown == len(self._marker_pool):
+                oval = self.canvas.create_oval(0, 0, 0, 0, tags="markers")
+                text = self.canvas.create_text(0, 0, anchor="w", font=("Arial", 9), tags="markers")
+                self._marker_pool.append((oval, text))
+            oval, text = self._marker_pool[shown]
+            shown += 1
+
+            self.canvas.coords(
+                oval,
+                canvas_x - 10, canvas_y - 10,
+                canvas_x + 10, canvas_y + 10
+            )
+            self.canvas.itemconfigure(oval, outline=color, width=width_val, state="normal")
+            self.canvas.coords(text, canvas_x + 15, canvas_y)
+            self.canvas.itemconfigure(text, text=display_id, fill=color, state="normal")
+
+        for oval, text in self._marker_pool[shown:]:
+            self.canvas.itemconfigure(oval, state="hidden")
+            self.canvas.itemconfigure(text, state="hidden")
+
+    def _refresh_links(self, band):
+        """Update the link annotation layer for the current page within a y-band."""
+        current_id = self._current_section_id()
+        band_top, band_bottom = band
+
+        # Reuse pooled canvas items, moving them in place rather than recreating
+        shown = 0
+        page_links = self._links_by_page.get(self.current_page, ())
+        canvas_rects = self._current_link_canvas_rects()
+        for i, link in enumerate(page_links):
+            cx0, cy0, cx1, cy1 = canvas_rects[i]
+            if cy1 < band_top or cy0 > band_bottom:
+                continue
 
-        # Draw link annotation rectangles on this page
-        for link in self.link_annotations:
-            if link["page"] == self.current_page:
-                x0, y0, x1, y1 = link["rect"]
-                cx0, cy0 = x0 * self.zoom, y0 * self.zoom
-                cx1, cy1 = x1 * self.zoom, y1 * self.zoom
+            is_current = link["dest_id"] == current_id
+            if link["type"] == "url":
+                color = "purple" if is_current else "violet"
+            else:
+                color = "blue" if is_current else "cyan"
 
-                is_current = link["dest_id"] == current_id
-                if link["type"] == "url":
-                    color = "purple" if is_current else "violet"
-                else:
-                    color = "blue" if is_current else "cyan"
+            width_val = 3 if is_current else 2
+            dash = () if link.get("existing") else (4, 2)
+            label = "[URL]" if link["type"] == "url" else "->"
 
-                width_val = 3 if is_current else 2
-                dash = () if link.get("existing") else (4, 2)
+            if shown == len(self._link_pool):
+                rect = self.canvas.create_rectangle(0, 0, 0, 0, tags="links")
+                text = self.canvas.create_text(0, 0, anchor="nw", font=("Arial", 10), tags="links")
+                self._link_pool.append((rect, text))
+            rect, text = self._link_pool[shown]
+            shown += 1
 
-                self.canvas.create_rectangle(
-                    cx0, cy0, cx1, cy1,
-                    outline=color, width=width_val, dash=dash
-                )
+            self.canvas.coords(rect, cx0, cy0, cx1, cy1)
+            self.canvas.itemconfigure(rect, outline=color, width=width_val, dash=dash, state="normal")
+            self.canvas.coords(text, cx0 + 5, cy0 + 5)
+            self.canvas.itemconfigure(text, text=label, fill=color, state="normal")
 
-                label = "[URL]" if link["type"] == "url" else "->"
-                self.canvas.create_text(
-                    cx0 + 5, cy0 + 5,
-                    text=label,
-                    anchor="nw",
-                    fill=color,
-                    font=("Arial", 10)
-                )
+        for rect, text in self._link_pool[shown:]:
+            self.canvas.itemconfigure(rect, state="hidden")
+            self.canvas.itemconfigure(text, state="hidden")
 
     def on_mouse_down(self, event):
         """Handle mouse button down - start of click or drag."""
@@ -747,11 +1031,20 @@ class PDFDestinationPicker:
         # Check if clicking on a link region to delete it
         if self.hovered_link_index is not None:
             if self.delete_link_at_position(canvas_x, canvas_y):
-                self.update_display()
+                self._refresh_overlays()
                 return
 
         self.drag_start = (canvas_x, canvas_y)
-        self.drag_rect = None
+
+        # One feedback rectangle is reused for every drag; it stays hidden until moved
+        if self.drag_rect is None:
+            self.drag_rect = self.canvas.create_rectangle(
+                canvas_x, canvas_y, canvas_x, canvas_y,
+                outline="red", width=2, dash=(4, 4), tags="drag", state="hidden"
+            )
+        else:
+            self.canvas.coords(self.drag_rect, canvas_x, canvas_y, canvas_x, canvas_y)
+        self.canvas.tag_raise(self.drag_rect)
 
     def on_mouse_drag(self, event):
         """Handle mouse drag - drawing link region."""
@@ -761,14 +1054,9 @@ class PDFDestinationPicker:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
-        if self.drag_rect:
-            self.canvas.delete(self.drag_rect)
-
         x0, y0 = self.drag_start
-        self.drag_rect = self.canvas.create_rectangle(
-            x0, y0, canvas_x, canvas_y,
-            outline="red", width=2, dash=(4, 4)
-        )
+        self.canvas.coords(self.drag_rect, x0, y0, canvas_x, canvas_y)
+        self.canvas.itemconfigure(self.drag_rect, state="normal")
 
     def on_mouse_up(self, event):
         """Handle mouse button up - end of click or drag."""
@@ -781,16 +1069,14 @@ class PDFDestinationPicker:
 
         drag_distance = ((canvas_x - x0) ** 2 + (canvas_y - y0) ** 2) ** 0.5
 
-        if self.drag_rect:
-            self.canvas.delete(self.drag_rect)
-            self.drag_rect = None
+        self.canvas.itemconfigure(self.drag_rect, state="hidden")
 
         if self.current_section_idx >= len(self.sections):
             self.drag_start = None
             return
 
         section = self.sections[self.current_section_idx]
-        section_id = section.get('id', title_to_id(section.get('title', '')))
+        section_id = section['id']
         is_url = section.get('type') == 'url'
 
         if drag_distance < 10:
@@ -802,10 +1088,13 @@ class PDFDestinationPicker:
             pdf_y = y0 / self.zoom
 
             was_new = section_id not in self.destinations
-            self.destinations[section_id] = (self.current_page, pdf_x, pdf_y)
+            self._set_destination(section_id, self.current_page, pdf_x, pdf_y)
 
             action = "[+]" if was_new else "[~]"
             print(f"{action} {section_id}: page {self.current_page + 1}, position ({pdf_x:.0f}, {pdf_y:.0f})")
+            # Destination status shows in the list and labels, so refresh everything
+            self.drag_start = None
+            self.update_display()
         else:
             pdf_x0 = min(x0, canvas_x) / self.zoom
             pdf_y0 = min(y0, canvas_y) / self.zoom
@@ -813,18 +1102,21 @@ class PDFDestinationPicker:
             pdf_y1 = max(y0, canvas_y) / self.zoom
 
             link_type = "url" if is_url else "local"
-            self.link_annotations.append({
+            link = {
                 "page": self.current_page,
                 "rect": (pdf_x0, pdf_y0, pdf_x1, pdf_y1),
                 "dest_id": section_id,
                 "type": link_type,
                 "existing": False
-            })
+            }
+            self.link_annotations.append(link)
+            self._links_by_page.setdefault(self.current_page, []).append(link)
+            self._links_changed(self.current_page)
 
             print(f"[LINK] Link region created: {section_id} on page {self.current_page + 1}")
-
-        self.drag_start = None
-        self.update_display()
+            # A new link only changes the overlay layers
+            self.drag_start = None
+            self._refresh_overlays()
 
     def on_mouse_motion(self, event):
         """Handle mouse motion for hover effects on link regions."""
@@ -834,43 +1126,31 @@ class PDFDestinationPicker:
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
 
-        hovered_idx = None
-        for i, link in enumerate(self.link_annotations):
-            if link["page"] != self.current_page:
-                continue
-
-            x0, y0, x1, y1 = link["rect"]
-            cx0, cy0 = x0 * self.zoom, y0 * self.zoom
-            cx1, cy1 = x1 * self.zoom, y1 * self.zoom
-
-            if cx0 <= canvas_x <= cx1 and cy0 <= canvas_y <= cy1:
-                hovered_idx = i
-                break
-
+        hovered_idx = self._link_index_at(canvas_x, canvas_y)
         if hovered_idx != self.hovered_link_index:
             self.hovered_link_index = hovered_idx
-            if hovered_idx is not None:
-                self.canvas.config(cursor="X_cursor")
-            else:
-                self.canvas.config(cursor="")
+            self._refresh_hover()
+
+    def _refresh_hover(self):
+        """Update hover feedback without touching the page image or overlays."""
+        if self.hovered_link_index is not None:
+            self.canvas.config(cursor="X_cursor")
+        else:
+            self.canvas.config(cursor="")
 
     def delete_link_at_position(self, canvas_x, canvas_y):
         """Delete link region at the given canvas position."""
-        for i, link in enumerate(self.link_annotations):
-            if link["page"] != self.current_page:
-                continue
-
-            x0, y0, x1, y1 = link["rect"]
-            cx0, cy0 = x0 * self.zoom, y0 * self.zoom
-            cx1, cy1 = x1 * self.zoom, y1 * self.zoom
-
-            if cx0 <= canvas_x <= cx1 and cy0 <= canvas_y <= cy1:
-                del self.link_annotations[i]
-                print(f"[-] Link region deleted: {link['dest_id'][:40]}...")
-                self.hovered_link_index = None
-                self.canvas.config(cursor="")
-                return True
-        return False
+        i = self._link_index_at(canvas_x, canvas_y)
+        if i is None:
+            return False
+
+        link = self._links_by_page[self.current_page].pop(i)
+        self._links_changed(self.current_page)
+        self.link_annotations = [l for l in self.link_annotations if l is not link]
+        print(f"[-] Link region deleted: {link['dest_id'][:40]}...")
+        self.hovered_link_index = None
+        self.canvas.config(cursor="")
+        return True
 
     def on_key_left(self, event):
         self.prev_page()
@@ -889,20 +1169,33 @@ class PDFDestinationPicker:
         return "break"
 
     def on_scroll_up(self, event):
-        self._do_scroll(-3)
+        self._queue_scroll(-3)
         return "break"
 
     def on_scroll_down(self, event):
-        self._do_scroll(3)
+        self._queue_scroll(3)
         return "break"
 
     def on_mouse_wheel(self, event):
         if event.delta > 0:
-            self._do_scroll(-3)
+            self._queue_scroll(-3)
         else:
-            self._do_scroll(3)
+            self._queue_scroll(3)
         return "break"
 
+    def _queue_scroll(self, units):
+        """Accumulate wheel ticks and apply them together once Tk is idle."""
+        self._pending_scroll += units
+        if self._scroll_job is None:
+            self._scroll_job = self.root.after_idle(self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Apply the accumulated wheel scrolling in a single step."""
+        self._scroll_job = None
+        units, self._pending_scroll = self._pending_scroll, 0
+        if units:
+            self._do_scroll(units)
+
     def _do_scroll(self, units):
         """Scroll the canvas, changing pages at boundaries."""
         top, bottom = self.canvas.yview()
@@ -915,7 +1208,7 @@ class PDFDestinationPicker:
             else:
                 self.canvas.yview_scroll(units, "units")
         else:
-            if bottom >= 1.0 and self.current_page < len(self.doc) - 1:
+            if bottom >= 1.0 and self.current_page < self._n_pages - 1:
                 self.current_page += 1
                 self.update_display()
                 self.canvas.yview_moveto(0.0)
@@ -928,16 +1221,24 @@ class PDFDestinationPicker:
             self.update_display()
 
     def next_page(self):
-        if self.current_page < len(self.doc) - 1:
+        if self.current_page < self._n_pages - 1:
             self.current_page += 1
             self.update_display()
 
     def zoom_in(self):
-        self.zoom = min(3.0, self.zoom + 0.25)
-        self.update_display()
+        self._change_zoom(ZOOM_STEP)
 
     def zoom_out(self):
-        self.zoom = max(0.5, self.zoom - 0.25)
+        self._change_zoom(-ZOOM_STEP)
+
+    def _change_zoom(self, delta):
+        """Step the zoom within limits, skipping the redraw if it didn't change."""
+        new_zoom = max(ZOOM_MIN, min(ZOOM_MAX, self.zoom + delta))
+        # Snap to the step grid so page cache keys repeat exactly
+        new_zoom = round(new_zoom / ZOOM_STEP) * ZOOM_STEP
+        if new_zoom == self.zoom:
+            return
+        self.zoom = new_zoom
         self.update_display()
 
     def prev_section(self):
@@ -956,23 +1257,17 @@ class PDFDestinationPicker:
         """Navigate to the page of the current section's destination (if any)."""
         if self.current_section_idx < len(self.sections):
             section = self.sections[self.current_section_idx]
-            section_id = section.get('id', title_to_id(section.get('title', '')))
-            if section_id in self.destinations:
-                page_num, x, y = self.destinations[section_id]
-                self.current_page = page_num
-            elif section_id in self.existing_destinations:
-                page_num, x, y = self.existing_destinations[section_id]
-                self.current_page = page_num
+            section_id = section['id']
+            dest = self.destinations.get(section_id) or self.existing_destinations.get(section_id)
+            if dest is not None:
+                self.current_page = dest[0]
 
     def remove_current_destination(self):
         """Remove the position for the current destination."""
         if self.current_section_idx < len(self.sections):
             section = self.sections[self.current_section_idx]
-            section_id = section.get('id', title_to_id(section.get('title', '')))
-            removed = False
-            if section_id in self.destinations:
-                del self.destinations[section_id]
-                removed = True
+            section_id = section['id']
+            removed = self._clear_destination(section_id)
             if section_id in self.existing_destinations:
                 del self.existing_destinations[section_id]
                 removed = True
@@ -985,13 +1280,17 @@ class PDFDestinationPicker:
 
     def save_and_quit(self):
         """Save the PDF with named destinations and link annotations."""
-        # Merge existing destinations with new ones
-        all_destinations = dict(self.existing_destinations)
-        all_destinations.update(self.destinations)
-
-        # Filter out URL destinations
-        url_ids = {s.get('id') for s in self.sections if s.get('type') == 'url'}
-        all_destinations = {k: v for k, v in all_destinations.items() if k not in url_ids}
+        # Merge existing destinations with new ones, skipping URL destinations,
+        # and count new/modified ones in the same pass
+        url_ids = {s['id'] for s in self.sections if s.get('type') == 'url'}
+        all_destinations = {}
+        new_dest_count = 0
+        for section_id, dest in {**self.existing_destinations, **self.destinations}.items():
+            if section_id in url_ids:
+                continue
+            all_destinations[section_id] = dest
+            if section_id in self.destinations:
+                new_dest_count += 1
 
         # Count link changes
         new_links = [l for l in self.link_annotations if not l.get("existing")]
@@ -1001,41 +1300,65 @@ class PDFDestinationPicker:
 
         if not all_destinations and not has_link_changes:
             if messagebox.askyesno("No changes", "No destinations or links have been added. Exit anyway?"):
-                self.doc.close()
+                self._close_document()
                 self.root.quit()
             return
 
-        page_heights = [self.doc[i].rect.height for i in range(len(self.doc))]
-
-        self.doc.close()
-
+        # Import before closing the document so a missing pypdf keeps the session open
         try:
             from pypdf import PdfReader, PdfWriter
             from pypdf.generic import (
                 ArrayObject, NameObject, NullObject, FloatObject,
-                DictionaryObject
+                DictionaryObject, NumberObject, RectangleObject, TextStringObject
             )
         except ImportError:
             messagebox.showerror("Error", "pypdf not installed. Run: pip install pypdf")
             return
 
-        new_dest_count = len([d for d in self.destinations if d not in url_ids])
+        # Only pages that gained a link or lost an existing one need rewriting
+        changed_pages = {l["page"] for l in new_links}
+        for page_num, original_count in self._original_links_by_page.items():
+            kept = sum(1 for l in self._links_by_page.get(page_num, ()) if l.get("existing"))
+            if kept < original_count:
+                changed_pages.add(page_num)
+
+        # Link rects are in MuPDF page space; map them to PDF user space (as
+        # page.insert_link would) while the document is still open
+        link_pdf_rects = {}
+        for page_num in changed_pages:
+            ictm = ~self.doc[page_num].transformation_matrix
+            for link in self._links_by_page.get(page_num, ()):
+                link_pdf_rects[id(link)] = tuple(fitz.Rect(link["rect"]) * ictm)
+
+        self._close_document()
+
         preserved_count = len(all_destinations) - new_dest_count
         print(f"\nStep 1: Adding {len(all_destinations)} destinations ({new_dest_count} new/modified, {preserved_count} preserved)...")
 
-        reader = PdfReader(str(self.pdf_path))
-        writer = PdfWriter()
+        try:
+            # Append only the changed objects, keeping existing streams byte-for-byte
+            writer = PdfWriter(str(self.pdf_path), incremental=True)
+        except TypeError:
+            # pypdf < 5.0 has no incremental mode: copy the pages into a new file
+            reader = PdfReader(str(self.pdf_path))
+            writer = PdfWriter()
 
-        for page in reader.pages:
-            writer.add_page(page)
+            for page in reader.pages:
+                writer.add_page(page)
 
-        if reader.metadata:
-            writer.add_metadata(reader.metadata)
+            if reader.metadata:
+                writer.add_metadata(reader.metadata)
+        else:
+            root = writer._root_object
+            names = root["/Names"] if "/Names" in root else None
+            if isinstance(names, DictionaryObject) and "/Dests" in names:
+                # Names-tree destinations were loaded and are rewritten to /Dests below
+                del names["/Dests"]
 
         dests_dict = DictionaryObject()
 
         for section_id, (page_num, x, y) in all_destinations.items():
-            page_height = page_heights[page_num] if page_num < len(page_heights) else 800
+            page_height = self._page_heights[page_num] if page_num < self._n_pages else 800
             pdf_y = page_height - y
 
             page_ref = writer.pages[page_num].indirect_reference
@@ -1054,13 +1377,11 @@ class PDFDestinationPicker:
 
         if dests_dict:
             writer._root_object[NameObject("/Dests")] = writer._add_object(dests_dict)
+        elif "/Dests" in writer._root_object:
+            # All destinations were removed; don't keep the original catalog entry
+            del writer._root_object["/Dests"]
 
-        temp_path = self.pdf_path.with_suffix('.tmp.pdf')
-        with open(temp_path, 'wb') as f:
-            writer.write(f)
-        print(f"  Destinations saved to temp file")
-
-        # Step 2: Handle link annotations
+        # Step 2: Handle link annotations in the same writer pass
         if has_link_changes:
             print(f"\nStep 2: Updating link annotations...")
             if removed_existing_links > 0:
@@ -1070,46 +1391,50 @@ class PDFDestinationPicker:
             if kept_existing_links:
                 print(f"  Preserving {len(kept_existing_links)} existing link(s)")
 
-            doc = fitz.open(str(temp_path))
-
-            # Delete ALL existing links first
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                links = page.get_links()
-                for link in links:
-                    page.delete_link(link)
-
-            # Re-add all links we want to keep
-            for link in self.link_annotations:
-                page = doc[link["page"]]
-                x0, y0, x1, y1 = link["rect"]
-                rect = fitz.Rect(x0, y0, x1, y1)
-
-                if link["type"] == "url":
-                    page.insert_link({
-                        "kind": fitz.LINK_URI,
-                        "from": rect,
-                        "uri": link["dest_id"]
-                    })
-                    marker = "[o]" if link.get("existing") else "[+]"
-                    print(f"  {marker} [URL]: {link['dest_id'][:50]}...")
-                else:
-                    page.insert_link({
-                        "kind": fitz.LINK_NAMED,
-                        "from": rect,
-                        "name": link["dest_id"]
+            for page_num in sorted(changed_pages):
+                page = writer.pages[page_num]
+                # Drop ALL existing links, keeping other annotations (notes, form fields, ...)
+                annots = ArrayObject()
+                if "/Annots" in page:
+                    for annot_ref in page["/Annots"].get_object():
+                        if annot_ref.get_object().get("/Subtype") != "/Link":
+                            annots.append(annot_ref)
+
+                # Re-add all links we want to keep
+                for link in self._links_by_page.get(page_num, ()):
+                    if link["type"] == "url":
+                        action = DictionaryObject({
+                            NameObject("/S"): NameObject("/URI"),
+                            NameObject("/URI"): TextStringObject(link["dest_id"])
+                        })
+                        marker = "[o]" if link.get("existing") else "[+]"
+                        print(f"  {marker} [URL]: {link['dest_id'][:50]}...")
+                    else:
+                        action = DictionaryObject({
+                            NameObject("/S"): NameObject("/GoTo"),
+                            NameObject("/D"): TextStringObject(link["dest_id"])
+                        })
+                        marker = "[o]" if link.get("existing") else "[+]"
+                        print(f"  {marker} -> {link['dest_id']}")
+
+                    annot = DictionaryObject({
+                        NameObject("/Type"): NameObject("/Annot"),
+                        NameObject("/Subtype"): NameObject("/Link"),
+                        NameObject("/Rect"): RectangleObject(link_pdf_rects[id(link)]),
+                        NameObject("/BS"): DictionaryObject({NameObject("/W"): NumberObject(0)}),
+                        NameObject("/A"): action
                     })
-                    marker = "[o]" if link.get("existing") else "[+]"
-                    print(f"  {marker} -> {link['dest_id']}")
+                    annots.append(writer._add_object(annot))
 
-            final_path = self.pdf_path.with_suffix('.final.pdf')
-            doc.save(str(final_path), garbage=4, deflate=True)
-            doc.close()
+                if annots:
+                    page[NameObject("/Annots")] = annots
+                elif "/Annots" in page:
+                    del page["/Annots"]
 
-            temp_path.unlink()
-            final_path.replace(self.pdf_path)
-        else:
-            temp_path.replace(self.pdf_path)
+        temp_path = self.pdf_path.with_suffix('.tmp.pdf')
+        with open(temp_path, 'wb') as f:
+            writer.write(f)
+        temp_path.replace(self.pdf_path)
 
         print(f"\n[OK] PDF saved: {self.pdf_path.name}")
         msg = f"Saved to {self.pdf_path.name}:\n"
@@ -1127,9 +1452,20 @@ class PDFDestinationPicker:
     def cancel(self):
         """Cancel without saving."""
         if messagebox.askyesno("Cancel", "Are you sure you want to cancel? Changes will not be saved."):
-            self.doc.close()
+            self._close_document()
             self.root.quit()
 
+    def _close_document(self):
+        """Close the PDF and drop cached page images and pending callbacks."""
+        for job in (self._prefetch_job, self._scroll_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._prefetch_job = None
+        self._scroll_job = None
+        self._prefetch_queue = []
+        self._page_cache.clear()
+        self.doc.close()
+
     def run(self):
         self.root.mainloop()
 
@@ -1154,19 +1490,11 @@ def diagnose_pdf(pdf_path):
                 total_links += 1
                 kind = link.get("kind")
                 rect = link.get("from")
-                kind_names = {
-                    0: "LINK_NONE",
-                    1: "LINK_GOTO",
-                    2: "LINK_URI",
-                    3: "LINK_LAUNCH",
-                    4: "LINK_NAMED",
-                    5: "LINK_GOTOR"
-                }
-                kind_name = kind_names.get(kind, f"UNKNOWN({kind})")
+                kind_name = _PDF_LINK_KIND_NAMES.get(kind, f"UNKNOWN({kind})")
                 print(f"  [{i+1}] {kind_name}")
                 print(f"      rect: ({rect.x0:.1f}, {rect.y0:.1f}) - ({rect.x1:.1f}, {rect.y1:.1f})")
                 for key, value in link.items():
-                    if key not in ['kind', 'from', 'xref']:
+                    if key not in _DIAGNOSE_SKIP_KEYS:
                         print(f"      {key}: {value}")
 
     print(f"\nTotal links (PyMuPDF): {total_links}")
@@ -1216,6 +1544,9 @@ Examples:
 
   %(prog)s document.pdf --diagnose
       Show existing destinations and links in PDF
+
+  %(prog)s document.pdf --quiet
+      Skip the startup listing of existing destinations and links
         """
     )
 
@@ -1223,6 +1554,7 @@ Examples:
     parser.add_argument('--titles', nargs='+', help='Destination titles to add')
     parser.add_argument('--json', dest='json_file', help='JSON file with destinations')
     parser.add_argument('--diagnose', action='store_true', help='Diagnose PDF structure')
+    parser.add_argument('--quiet', action='store_true', help='Do not list existing destinations and links on startup')
 
     args = parser.parse_args()
 
@@ -1266,7 +1598,7 @@ Examples:
     print("  - Click 'Save and quit' when done")
     print()
 
-    app = PDFDestinationPicker(pdf_path, destinations)
+    app = PDFDestinationPicker(pdf_path, destinations, quiet=args.quiet)
     app.run()
 
 